@@ -11,40 +11,82 @@ writing, software distributed under the License is distributed on an "AS
 IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
+import gzip
+import io
+import json
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from ipaddress import IPv4Network
-from time import sleep
+from time import monotonic, sleep
 
+import fastjsonschema
 import yaml
 from dnacentersdk import api
 from dnacentersdk.exceptions import ApiError
 from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from rich import print
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import track
 from rich.prompt import Confirm
-from schema import Schema, SchemaError
+from urllib3.util.retry import Retry
+
+# Prefer libyaml-backed loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 console = Console()
 
-config_schema = Schema(
-    {
-        "border_nodes": [str],
-        "fusion_router": str,
-        "vrfs": {str: {"rd": str, "vlans": [int], "import": [str]}},
-    }
-)
+CONFIG_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "border_nodes": {"type": "array", "items": {"type": "string"}},
+        "fusion_router": {"type": "array", "items": {"type": "string"}},
+        "vrfs": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {
+                    "rd": {"type": "string"},
+                    "vlans": {"type": "array", "items": {"type": "integer"}},
+                    "import": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["rd", "vlans", "import"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["border_nodes", "fusion_router", "vrfs"],
+    "additionalProperties": False,
+}
+
+# Compile config validator once at import
+validate_config = fastjsonschema.compile(CONFIG_JSON_SCHEMA)
 
 
 # Load environment variables
 load_dotenv()
 
 # Load Jinja config templates
-conf_templates = Environment(loader=FileSystemLoader("templates/"))
+# Compiled templates are cached on disk to skip re-parsing on later runs
+os.makedirs(".jinja_cache", exist_ok=True)
+conf_templates = Environment(
+    loader=FileSystemLoader("templates/"),
+    bytecode_cache=FileSystemBytecodeCache(".jinja_cache"),
+)
+BGP_TPL = conf_templates.get_template("bgp.jinja2")
+BGP_PEERS_TPL = conf_templates.get_template("bgp_peers.jinja2")
+VLAN_TPL = conf_templates.get_template("vlan_interface.jinja2")
+VRF_TPL = conf_templates.get_template("vrf.jinja2")
 
 # Fetch DNAC config
 DNAC_HOST = os.getenv("DNAC_HOST")
@@ -59,23 +101,81 @@ if any(x is None for x in [DNAC_HOST, DNAC_USER, DNAC_PASSWORD, DNAC_PROJECT_NAM
     print("Please configure: DNAC_HOST, DNAC_USER, DNAC_PASSWORD, DNAC_PROJECT_NAME")
     sys.exit(1)
 
+# Max number of concurrent DNAC API requests
+MAX_WORKERS = 16
+# Minimum delay between DNAC status polls, in seconds
+MIN_POLL_INTERVAL = 0.1
+# Template uploads larger than this (in bytes) are sent gzip-compressed.
+# Compressed uploads bypass the SDK, so the template-programmer endpoint URLs
+# and request body in uploadTemplate mirror what dnacentersdk 2.6.6 sends for
+# create_template / update_template - re-check them when upgrading the SDK.
+GZIP_MIN_SIZE = 4096
+# Separator between generated config sections
+CONFIG_SEPARATOR = "\r\n!\r\n"
+# Only render progress bars for loops with more items than this
+PROGRESS_THRESHOLD = 50
+
+# Used to validate deployment IDs returned by DNAC
+UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
 global config
 
 
-def checkTaskStatus(dnac, task: str) -> str:
+def progress(items, description: str):
+    """
+    Wrap iterable in a progress bar, only if it is large enough to be worth
+    the rendering overhead
+    """
+    if len(items) > PROGRESS_THRESHOLD:
+        return track(items, description=description, update_period=0.2)
+    return items
+
+
+def checkTaskStatus(
+    dnac, task: str, initial_interval: float = 0.2, max_interval: float = 2.0
+) -> str:
     """
     General function to check DNA Center task status.
     """
+    delay = max(MIN_POLL_INTERVAL, initial_interval)
+    max_interval = max(delay, max_interval)
+    print("Waiting for task to finish. Current status: Not Started")
     while True:
-        print("Waiting for task to finish. Current status: Not Started")
         task_status = dnac.task.get_task_by_id(task.response.taskId)
-        print(
-            f"Waiting for task to finish. Current status: {task_status['response']['progress']}"
-        )
         if task_status["response"]["endTime"]:
+            if task_status["response"].get("isError"):
+                print("[red][bold]Task failed! Error:")
+                print(task_status["response"].get("failureReason"))
+                sys.exit(1)
             print("[green][bold]Task finsished!")
             return task_status
-        sleep(3)
+        print(
+            f"Waiting for task to finish. Current status: {task_status['response']['progress']}"
+        )
+        sleep(delay)
+        delay = min(max_interval, delay * 1.5)
+
+
+def configureSession(dnac: api.DNACenterAPI) -> None:
+    """
+    Size DNAC SDK connection pool for concurrent requests, so connections are
+    kept alive & reused rather than re-established per call
+    """
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_WORKERS,
+        # Retry idempotent requests on transient gateway errors. Rate limiting
+        # (429) is already handled by the SDK itself
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    dnac._session._req_session.mount("https://", adapter)
 
 
 def connectDNAC() -> api.DNACenterAPI | None:
@@ -91,6 +191,7 @@ def connectDNAC() -> api.DNACenterAPI | None:
                 base_url=f"https://{DNAC_HOST}",
                 verify=False,
             )
+            configureSession(dnac)
         print("[green]Connected to DNA Center!")
         return dnac
     except Exception as e:
@@ -99,14 +200,23 @@ def connectDNAC() -> api.DNACenterAPI | None:
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
+def getProject(dnac: api.DNACenterAPI) -> list:
+    """
+    Fetch DNA Center template project. Result is cached, so call
+    getProject.cache_clear() after adding templates to the project.
+    """
+    print("Querying DNA Center for project list...")
+    return dnac.configuration_templates.get_projects(name=DNAC_PROJECT_NAME)
+
+
 def getProjectID(dnac: api.DNACenterAPI) -> str:
     """
     General function to locate DNA Center project identifier, which will be required to
     add/remove templates.
     """
     # Retrieve UUID for Template project
-    print("Querying DNA Center for project list...")
-    project = dnac.configuration_templates.get_projects(name=DNAC_PROJECT_NAME)
+    project = getProject(dnac)
     project_id = project[0]["id"]
     return project_id
 
@@ -115,23 +225,42 @@ def getTemplateID(dnac: api.DNACenterAPI) -> str:
     """
     Looks up template ID by name
     """
-    project = dnac.configuration_templates.get_projects(name=DNAC_PROJECT_NAME)
+    project = getProject(dnac)
     if len(project[0]["templates"]) == 0:
         print("Project has no templates yet")
-        template_id = None
         return
-    for template in project[0]["templates"]:
-        if template["name"] == DNAC_TEMPLATE_NAME:
-            template_id = template["id"]
-            break
-        else:
-            print(f"Template {DNAC_TEMPLATE_NAME} does not exist yet")
-            template_id = None
-            return
+    templates_by_name = {t["name"]: t["id"] for t in project[0]["templates"]}
+    template_id = templates_by_name.get(DNAC_TEMPLATE_NAME)
+    if not template_id:
+        print(f"Template {DNAC_TEMPLATE_NAME} does not exist yet")
+        return
     print(f"Using template ID: {template_id}")
     return template_id
 
 
+def uploadCompressed(
+    dnac: api.DNACenterAPI, method: str, resource_path: str, body: dict
+) -> dict | None:
+    """
+    Send JSON request body gzip-compressed. Returns None if the compressed
+    request fails for any reason, so caller can fall back to a regular upload.
+    """
+    # custom_caller bypasses the SDK's request handling, so apply its timeout here.
+    # Any error falls back to the regular SDK call, which handles token refresh &
+    # rate limiting, and raises ApiError if the upload really fails
+    try:
+        return dnac.custom_caller.call_api(
+            method,
+            resource_path,
+            data=gzip.compress(json.dumps(body).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            timeout=dnac._session.single_request_timeout,
+        )
+    except RequestException as e:
+        print(f"[yellow]Compressed upload failed ({e}), retrying uncompressed...")
+        return None
+
+
 def uploadTemplate(
     dnac: api.DNACenterAPI, template_payload: str, device_info: dict
 ) -> str:
@@ -157,38 +286,64 @@ def uploadTemplate(
         "version": "2",
         "language": "VELOCITY",
     }
+    # Large templates are compressed to cut upload time over slow links
+    compress = len(template_payload.encode()) > GZIP_MIN_SIZE
+    body = {
+        k: v for k, v in template_params.items() if k not in ("project_id", "payload")
+    }
+    body.update(template_params["payload"])
     print("Uploading template to DNA Center...")
     # Push update if template exists
     if template_id:
         template_params["id"] = template_id
-        dnac.configuration_templates.update_template(**template_params)
-        # Allow DNAC a moment to update template
-        sleep(3)
+        body["id"] = template_id
+        task = None
+        if compress:
+            task = uploadCompressed(
+                dnac, "PUT", "/dna/intent/api/v1/template-programmer/template", body
+            )
+        if task is None:
+            task = dnac.configuration_templates.update_template(**template_params)
+        # Wait for DNAC to finish updating template
+        checkTaskStatus(dnac, task)
         print("Template updated.")
     # Create new if no existing template ID
     elif not template_id:
-        dnac.configuration_templates.create_template(**template_params)
-        # Allow DNAC a moment to create new template
-        sleep(3)
+        task = None
+        if compress:
+            task = uploadCompressed(
+                dnac,
+                "POST",
+                f"/dna/intent/api/v1/template-programmer/project/{project_id}/template",
+                body,
+            )
+        if task is None:
+            task = dnac.configuration_templates.create_template(**template_params)
+        # Wait for DNAC to finish creating new template
+        checkTaskStatus(dnac, task)
         print("Template created.")
+        # Project template list has changed, so refresh it
+        getProject.cache_clear()
         template_id = getTemplateID(dnac)
     # Commit new template
     print("Committing new template version...")
-    dnac.configuration_templates.version_template(
+    task = dnac.configuration_templates.version_template(
         comments="Commit via API", templateId=template_id
     )
+    # Wait for DNAC to finish committing new version
+    checkTaskStatus(dnac, task)
     print("Template committed.")
-    # Allow DNAC a moment...
-    sleep(3)
     print("[green]Template ready!")
     return template_id
 
 
-def deployTemplate(dnac: api.DNACenterAPI, template_id: str, device: dict) -> None:
+def startDeployment(
+    dnac: api.DNACenterAPI, template_id: str, name: str, device: dict
+) -> str | None:
     """
-    Push new configuration template to all target devices.
+    Start template deployment to a single device & return the deployment ID
     """
-    print(f"Starting deployment to {config['fusion_router'][0]} at {device['ip']}")
+    print(f"Starting deployment to {name} at {device['ip']}")
     target_devices = []
     target_devices.append(
         {
@@ -205,27 +360,121 @@ def deployTemplate(dnac: api.DNACenterAPI, template_id: str, device: dict) -> No
     deploy_id = str(deploy_template.deploymentId).split(":")[-1].strip()
     # If any errors are generated, they are included in the deploymentId field
     # So let's validate that we actually have a valid UUID - otherwise assume error
-    if not re.match("^.{8}-.{4}-.{4}-.{4}-.{12}$", deploy_id):
-        print("[red]Error deploying template: ")
+    if not UUID_RE.fullmatch(deploy_id):
+        print(f"[red]Error deploying template to {name}: ")
         print(deploy_template)
-    print("[green]Deployment started!")
-    with console.status("Checking deployment status...") as status:
-        while True:
-            # Monitor deployment status to see when it completes
-            response = dnac.configuration_templates.get_template_deployment_status(
-                deployment_id=deploy_id
-            )
-            if response["status"] == "SUCCESS" or response["status"] == "FAILURE":
-                break
-            else:
-                status.update(f"Deployment status: {response['status']}")
-                sleep(2)
+        return None
+    print(f"[green]Deployment to {name} started!")
+    return deploy_id
 
-    if response["status"] == "SUCCESS":
-        print("[green][bold]Deployment complete!")
-    if response["status"] == "FAILURE":
-        print("[red][bold]Deployment Failed! See below for errors:")
-        print(response)
+
+class DeploymentPoller:
+    """
+    Monitor multiple in-flight template deployments, checking every outstanding
+    deployment once per polling cycle
+    """
+
+    def __init__(
+        self,
+        dnac: api.DNACenterAPI,
+        initial_interval: float = 0.5,
+        max_interval: float = 5.0,
+        timeout: float = 600,
+    ) -> None:
+        self.dnac = dnac
+        self.initial_interval = max(MIN_POLL_INTERVAL, initial_interval)
+        self.max_interval = max(self.initial_interval, max_interval)
+        self.timeout = timeout
+        # Deployment ID -> device name
+        self.pending = {}
+        # Device name -> final deployment status
+        self.results = {}
+
+    def add(self, deploy_id: str, name: str) -> None:
+        """
+        Add a deployment to be monitored
+        """
+        self.pending[deploy_id] = name
+
+    def _poll_pending(self, status) -> None:
+        """
+        Check every outstanding deployment once, moving finished ones to results
+        """
+        for deploy_id in list(self.pending):
+            name = self.pending[deploy_id]
+            try:
+                response = (
+                    self.dnac.configuration_templates.get_template_deployment_status(
+                        deployment_id=deploy_id
+                    )
+                )
+            except (ApiError, RequestException) as e:
+                # Transient DNAC errors - keep polling, backing off further
+                status.update(f"Error checking deployment status ({name}): {e}")
+                continue
+            if response["status"] in ("SUCCESS", "FAILURE"):
+                self.results[name] = response
+                del self.pending[deploy_id]
+            else:
+                status.update(f"Deployment status ({name}): {response['status']}")
+
+    def wait_all(self) -> dict:
+        """
+        Poll until all deployments reach a terminal state & report results.
+        Raises TimeoutError if any deployment is still running after timeout.
+        """
+        delay = self.initial_interval
+        deadline = monotonic() + self.timeout
+        try:
+            with console.status("Checking deployment status...") as status:
+                while self.pending:
+                    if monotonic() > deadline:
+                        raise TimeoutError(
+                            f"Deployments still in progress after {self.timeout}s: "
+                            + ", ".join(self.pending.values())
+                        )
+                    self._poll_pending(status)
+                    if self.pending:
+                        sleep(delay)
+                        delay = min(self.max_interval, delay * 1.4)
+        finally:
+            # Report finished deployments, even if others timed out
+            for name, response in self.results.items():
+                if response["status"] == "SUCCESS":
+                    print(f"[green][bold]Deployment to {name} complete!")
+                if response["status"] == "FAILURE":
+                    print(
+                        f"[red][bold]Deployment to {name} Failed! See below for errors:"
+                    )
+                    print(response)
+        return self.results
+
+
+def deployTemplate(dnac: api.DNACenterAPI, template_id: str, devices: dict) -> dict:
+    """
+    Push new configuration template to all target devices.
+    """
+    targets = {
+        name: devices[name] for name in devices if devices[name]["role"] == "FUSION"
+    }
+    # Submit all deployments first, then monitor them together
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            name: executor.submit(startDeployment, dnac, template_id, name, device)
+            for name, device in targets.items()
+        }
+    poller = DeploymentPoller(dnac)
+    for name, future in futures.items():
+        # A failure on one device shouldn't stop monitoring of the others
+        try:
+            deploy_id = future.result()
+        except (ApiError, RequestException) as e:
+            print(f"[red]Error deploying template to {name}: ")
+            print(e)
+            continue
+        if deploy_id:
+            poller.add(deploy_id, name)
+    return poller.wait_all()
 
 
 def loadConfig() -> None:
@@ -236,11 +485,11 @@ def loadConfig() -> None:
     global config
     with open("./config.yaml", "r") as file:
         with console.status("Processing..."):
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=SafeLoader)
             try:
-                config_schema.validate(config)
+                validate_config(config)
                 print("[green]Config loaded!")
-            except SchemaError as e:
+            except fastjsonschema.JsonSchemaException as e:
                 print("[red]Failed to validate config.yaml. Error:")
                 print(e)
                 sys.exit(1)
@@ -251,66 +500,101 @@ def getDNACDevices(dnac: api.DNACenterAPI) -> dict:
     Retrieve DNA Center devices
     """
     print("Collecting device info...")
-    hostnames = [device + ".*" for device in config["border_nodes"]]
-    hostnames += [device + ".*" for device in config["fusion_router"]]
+    border_nodes = config["border_nodes"]
+    fusion_routers = config["fusion_router"]
+    hostnames = [device + ".*" for device in border_nodes]
+    hostnames += [device + ".*" for device in fusion_routers]
     devices = dnac.devices.get_device_list(hostname=hostnames)
     print(f"Got {len(devices.response)} devices.")
+    border_set = set(border_nodes)
+    fusion_set = set(fusion_routers)
     device_info = {}
-    for device in track(devices.response, description="Processing..."):
-        device_info[device.hostname] = {}
-        device_info[device.hostname]["ip"] = device["managementIpAddress"]
-        device_info[device.hostname]["uuid"] = device["id"]
-        device_info[device.hostname]["series"] = device["series"]
-        device_info[device.hostname]["family"] = device["family"]
-        for name in config["border_nodes"]:
-            if name in device.hostname:
-                device_info[device.hostname]["role"] = "BORDER"
-        for name in config["fusion_router"]:
-            if name in device.hostname:
-                device_info[device.hostname]["role"] = "FUSION"
+    for device in progress(devices.response, description="Processing..."):
+        info = device_info[device.hostname] = {}
+        info["ip"] = device["managementIpAddress"]
+        info["uuid"] = device["id"]
+        info["series"] = device["series"]
+        info["family"] = device["family"]
+        # Match on full or short hostname (without domain), so that one configured
+        # name being a substring of another doesn't tag the wrong device
+        names = {device.hostname, device.hostname.split(".", 1)[0]}
+        if names & fusion_set:
+            info["role"] = "FUSION"
+        elif names & border_set:
+            info["role"] = "BORDER"
+        else:
+            info["role"] = None
+            print(
+                f"[yellow]{device.hostname} does not match any border node or fusion router in config.yaml, ignoring"
+            )
     print("[green]Done!")
     return device_info
 
 
+def fetchBorder(dnac: api.DNACenterAPI, device: dict, vlan_to_vrf: dict) -> tuple:
+    """
+    Query SDA fabric for a single border node & parse L3 handoff links
+    """
+    peer_info = dnac.sda.gets_border_device_detail(device["ip"])
+    name = peer_info["name"]
+    device_settings = peer_info["deviceSettings"]
+    # Note: For now this assumes only 1 IP transit available/configured
+    ext_settings = device_settings["extConnectivitySettings"][0]
+    l3 = ext_settings["l3Handoff"]
+    peer = {}
+    peer["local_as"] = ext_settings["externalDomainProtocolNumber"]
+    peer["l3links"] = []
+    for link in l3:
+        # Border's remote side is the fusion router's local side & vice versa
+        remote_net = IPv4Network(link["remoteIpAddress"], strict=False)
+        local_net = IPv4Network(link["localIpAddress"], strict=False)
+        link_info = {}
+        link_info["remote_as"] = device_settings["internalDomainProtocolNumber"]
+        link_info["network"] = remote_net.network_address
+        link_info["local_ip"] = link["remoteIpAddress"].split("/")[0]
+        link_info["local_netmask"] = remote_net.netmask
+        link_info["remote_ip"] = link["localIpAddress"].split("/")[0]
+        link_info["remote_netmask"] = local_net.netmask
+        link_info["vlan_id"] = link["vlanId"]
+        vrf, rd, import_rt = vlan_to_vrf.get(link_info["vlan_id"], (None, None, None))
+        if vrf is None:
+            print(
+                f"[yellow]{name}: VLAN {link_info['vlan_id']} is not mapped to any VRF in config.yaml, skipping"
+            )
+            continue
+        link_info["vrf_name"] = vrf
+        link_info["rd"] = rd
+        link_info["import_rt"] = import_rt
+        peer["l3links"].append(link_info)
+    return name, peer
+
+
 def getBorderDeviceInfo(dnac: api.DNACenterAPI, devices: dict) -> dict:
     """
     Query border router info from SDA fabric
     """
     peers = {}
     print("Collecting border node configs...")
-    for device in track(devices):
-        if devices[device]["role"] == "BORDER":
-            peer_info = dnac.sda.gets_border_device_detail(devices[device]["ip"])
-            name = peer_info["name"]
-            device_settings = peer_info["deviceSettings"]
-            # Note: For now this assumes only 1 IP transit available/configured
-            ext_settings = device_settings["extConnectivitySettings"][0]
-            l3 = ext_settings["l3Handoff"]
-            peers[name] = {}
-            peers[name]["local_as"] = ext_settings["externalDomainProtocolNumber"]
-            peers[name]["l3links"] = []
-            for link in l3:
-                link_info = {}
-                link_info["remote_as"] = device_settings["internalDomainProtocolNumber"]
-                link_info["network"] = IPv4Network(
-                    link["remoteIpAddress"], strict=False
-                ).network_address
-                link_info["local_ip"] = link["remoteIpAddress"].split("/")[0]
-                link_info["local_netmask"] = IPv4Network(
-                    link["remoteIpAddress"], strict=False
-                ).netmask
-                link_info["remote_ip"] = link["localIpAddress"].split("/")[0]
-                link_info["remote_netmask"] = IPv4Network(
-                    link["localIpAddress"], strict=False
-                ).netmask
-                link_info["vlan_id"] = link["vlanId"]
-                for vrf in config["vrfs"]:
-                    for vlan in config["vrfs"][vrf]["vlans"]:
-                        if vlan == link_info["vlan_id"]:
-                            link_info["vrf_name"] = vrf
-                            link_info["rd"] = config["vrfs"][vrf]["rd"]
-                            link_info["import_rt"] = config["vrfs"][vrf]["import"]
-                peers[name]["l3links"].append(link_info)
+    borders = [
+        devices[device] for device in devices if devices[device]["role"] == "BORDER"
+    ]
+    # Build VLAN -> VRF lookup once, rather than scanning all VRFs for every link
+    vlan_to_vrf = {
+        vlan: (vrf, vrf_def["rd"], vrf_def["import"])
+        for vrf, vrf_def in config["vrfs"].items()
+        for vlan in vrf_def["vlans"]
+    }
+    # Queries are issued concurrently - worker threads share the SDK's
+    # underlying requests session, so connections are reused across calls
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(fetchBorder, dnac, device, vlan_to_vrf)
+            for device in borders
+        ]
+        # Collect in submission order, so generated config is stable between runs
+        for future in progress(futures, description="Processing..."):
+            name, peer = future.result()
+            peers[name] = peer
     print("[green]Done!")
     return peers
 
@@ -320,49 +604,39 @@ def generateFusionConfig(peers: dict) -> str:
     Generate Fusion router config based on peer config
     """
     print("Generating fusion router config...")
-    bgp_template = conf_templates.get_template("bgp.jinja2")
-    bgp_peers_template = conf_templates.get_template("bgp_peers.jinja2")
-    vlan_template = conf_templates.get_template("vlan_interface.jinja2")
-    vrf_template = conf_templates.get_template("vrf.jinja2")
-
     local_as = None
-
-    # Generate VLAN interface config first
-    vlan_config = []
-    for peer in track(peers, description="VLANs"):
-        if not local_as:
-            local_as = peers[peer]["local_as"]
-        for link in peers[peer]["l3links"]:
-            vlan_config.append(vlan_template.render(**link))
+    # Config sections are streamed into a single buffer, separated by "!" lines
+    config_buf = io.StringIO()
+    write = config_buf.write
+    vrf_render = VRF_TPL.render
+    vlan_render = VLAN_TPL.render
+    bgp_peers_render = BGP_PEERS_TPL.render
 
     # Generate VRF config
-    vrf_config = []
-    for vrf in track(config["vrfs"], description="VRFs "):
-        vrf_def = config["vrfs"][vrf]
-        vrf_config.append(
-            vrf_template.render(
-                vrf_name=vrf, rd=vrf_def["rd"], import_rt=vrf_def["import"]
-            )
-        )
+    for vrf, vrf_def in config["vrfs"].items():
+        write(vrf_render(vrf_name=vrf, rd=vrf_def["rd"], import_rt=vrf_def["import"]))
+        write(CONFIG_SEPARATOR)
+
+    # Generate VLAN interface config
+    separator = ""
+    for peer in peers.values():
+        if not local_as:
+            local_as = peer["local_as"]
+        for link in peer["l3links"]:
+            write(separator)
+            write(vlan_render(**link))
+            separator = CONFIG_SEPARATOR
+    write(CONFIG_SEPARATOR)
 
     # Generate BGP Config
-    vrfs = {}
-    for peer in track(peers, description="BGP  "):
-        for link in peers[peer]["l3links"]:
-            vrf_name = link["vrf_name"]
-            if not vrf_name in vrfs.keys():
-                vrfs[vrf_name] = []
-            vrfs[vrf_name].append(bgp_peers_template.render(link))
-    bgp_config = bgp_template.render(local_as=local_as, bgp_vrfs=vrfs)
+    vrfs = defaultdict(list)
+    for peer in peers.values():
+        for link in peer["l3links"]:
+            vrfs[link["vrf_name"]].append(bgp_peers_render(link))
+    write(BGP_TPL.render(local_as=local_as, bgp_vrfs=vrfs))
 
     print("[green]Configuration template generated!")
-    final_config = "\r\n!\r\n".join(vrf_config)
-    final_config += "\r\n!\r\n"
-    final_config += "\r\n!\r\n".join(vlan_config)
-    final_config += "\r\n"
-    final_config += "!\r\n" + bgp_config
-
-    return final_config
+    return config_buf.getvalue()
 
 
 def main():
@@ -408,10 +682,25 @@ def main():
     if not Confirm.ask("Proceed with deployment?"):
         print("\r\nQuitting...")
         sys.exit(0)
-    for device in devices:
-        if devices[device]["role"] == "FUSION":
-            deployTemplate(dnac, template_id, devices[device])
-            break
+    try:
+        results = deployTemplate(dnac, template_id, devices)
+    except TimeoutError as e:
+        print("[red]Timed out waiting for deployment to finish. Error:")
+        print(e)
+        sys.exit(1)
+    # Any fusion router that didn't start or didn't succeed fails the run
+    failed = [
+        name
+        for name in devices
+        if devices[name]["role"] == "FUSION"
+        and results.get(name, {}).get("status") != "SUCCESS"
+    ]
+    if not results and not failed:
+        print("[red]No fusion routers found to deploy to!")
+        sys.exit(1)
+    if failed:
+        print(f"[red][bold]Deployment did not succeed on: {', '.join(failed)}")
+        sys.exit(1)
 
     print("")
     print(Panel.fit("  -- Finished --  "))